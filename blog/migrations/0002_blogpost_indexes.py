@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['is_published', '-published_at'], name='blog_blogpo_is_publ_cd7c82_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['category', 'is_published', '-published_at'], name='blog_blogpo_categor_891f03_idx'),
+        ),
+    ]
@@ -84,6 +84,10 @@ class BlogPost(models.Model):
 
     class Meta:
         ordering = ['-published_at', '-created_at']
+        indexes = [
+            models.Index(fields=['is_published', '-published_at']),
+            models.Index(fields=['category', 'is_published', '-published_at']),
+        ]
 
     def __str__(self):
         return self.title
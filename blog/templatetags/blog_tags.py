@@ -6,4 +6,5 @@ register = template.Library()
 
 @register.simple_tag
 def latest_blog_posts(count=3):
-    return BlogPost.objects.filter(is_published=True).order_by('-published_at', '-created_at')[:count]
+    # Rendered in the footer of every page; only the link fields are needed
+    return BlogPost.objects.filter(is_published=True).only('title', 'slug').order_by('-published_at', '-created_at')[:count]
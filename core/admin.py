@@ -16,7 +16,7 @@ class PlanAdmin(admin.ModelAdmin):
 
 @admin.register(Subscription)
 class SubscriptionAdmin(admin.ModelAdmin):
-    pass
+    list_select_related = ('user', 'plan')
 
 
 @admin.register(Transaction)
@@ -1,7 +1,13 @@
 import uuid
 import hashlib
-from django.db import models
+import logging
+from django.db import models, transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
 
 
 class Configuration(models.Model):
@@ -11,16 +17,76 @@ class Configuration(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Values are read on every webhook / internal API call; cache them briefly
+    CACHE_TIMEOUT = 300
+
     def __str__(self):
         return self.key
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored key so a rename can invalidate the old entry
+        instance._loaded_key = instance.__dict__.get('key')
+        return instance
+
+    @staticmethod
+    def _cache_key(key):
+        return f"config:{key}"
+
     @staticmethod
     def get_value(key, default=None):
         """Get configuration value by key"""
+        cache_key = Configuration._cache_key(key)
         try:
-            return Configuration.objects.get(key=key).value
-        except Configuration.DoesNotExist:
-            return default
+            value = cache.get(cache_key)
+        except Exception:
+            logger.warning("Configuration cache read failed for %s", key, exc_info=True)
+            value = None
+        if value is None:
+            value = Configuration.objects.filter(key=key).values_list('value', flat=True).first()
+            if value is None:
+                return default
+            try:
+                cache.set(cache_key, value, Configuration.CACHE_TIMEOUT)
+            except Exception:
+                logger.warning("Configuration cache write failed for %s", key, exc_info=True)
+        return value
+
+    @staticmethod
+    def get_values(defaults):
+        """Get several configuration values in one query, keyed like `defaults`"""
+        try:
+            cached = cache.get_many([Configuration._cache_key(key) for key in defaults])
+        except Exception:
+            logger.warning("Configuration cache read failed", exc_info=True)
+            cached = {}
+        found = {
+            key: cached[Configuration._cache_key(key)]
+            for key in defaults if Configuration._cache_key(key) in cached
+        }
+        missing = [key for key in defaults if key not in found]
+        if missing:
+            fetched = dict(
+                Configuration.objects.filter(key__in=missing).values_list('key', 'value')
+            )
+            try:
+                cache.set_many(
+                    {Configuration._cache_key(key): value for key, value in fetched.items()},
+                    Configuration.CACHE_TIMEOUT,
+                )
+            except Exception:
+                logger.warning("Configuration cache write failed", exc_info=True)
+            found.update(fetched)
+        return {key: found.get(key, default) for key, default in defaults.items()}
+
+    @staticmethod
+    def invalidate_cache(*keys):
+        """Drop cached values for the given keys"""
+        try:
+            cache.delete_many([Configuration._cache_key(key) for key in keys if key])
+        except Exception:
+            logger.warning("Configuration cache invalidation failed for %s", keys, exc_info=True)
 
     @staticmethod
     def set_value(key, value):
@@ -34,6 +100,22 @@ class Configuration(models.Model):
         ordering = ['key']
 
 
+# Receivers (not save()/delete() overrides) so queryset deletes such as the
+# admin "Delete selected" action also invalidate cached values. Invalidation
+# runs on commit so a concurrent read can't re-cache the pre-commit row.
+@receiver(post_save, sender=Configuration)
+def invalidate_configuration_on_save(sender, instance, **kwargs):
+    keys = (instance.key, getattr(instance, '_loaded_key', None))
+    instance._loaded_key = instance.key
+    transaction.on_commit(lambda: Configuration.invalidate_cache(*keys))
+
+
+@receiver(post_delete, sender=Configuration)
+def invalidate_configuration_on_delete(sender, instance, **kwargs):
+    keys = (instance.key, getattr(instance, '_loaded_key', None))
+    transaction.on_commit(lambda: Configuration.invalidate_cache(*keys))
+
+
 class Plan(models.Model):
     """Pricing plans"""
     PLAN_TYPES = [
@@ -42,7 +42,7 @@ class BlogPostSitemap(Sitemap):
     priority = 0.8
 
     def items(self):
-        return BlogPost.objects.filter(is_published=True)
+        return BlogPost.objects.filter(is_published=True).only('slug', 'updated_at')
 
     def lastmod(self, obj):
         return obj.updated_at
@@ -15,27 +15,27 @@ class InstagramAccountAdmin(admin.ModelAdmin):
 
 @admin.register(DMFlow)
 class DMFlowAdmin(admin.ModelAdmin):
-    pass
+    list_select_related = ('user',)
 
 
 @admin.register(FlowNode)
 class FlowNodeAdmin(admin.ModelAdmin):
-    pass
+    list_select_related = ('flow',)
 
 
 @admin.register(QuickReplyOption)
 class QuickReplyOptionAdmin(admin.ModelAdmin):
-    pass
+    list_select_related = ('node__flow',)
 
 
 @admin.register(FlowSession)
 class FlowSessionAdmin(admin.ModelAdmin):
-    pass
+    list_select_related = ('flow',)
 
 
 @admin.register(FlowExecutionLog)
 class FlowExecutionLogAdmin(admin.ModelAdmin):
-    pass
+    list_select_related = ('session__flow',)
 
 
 @admin.register(CollectedLead)
@@ -60,32 +60,32 @@ class DroppedMessageAdmin(admin.ModelAdmin):
 
 @admin.register(QueuedFlowTrigger)
 class QueuedFlowTriggerAdmin(admin.ModelAdmin):
-    pass
+    list_select_related = ('flow',)
 
 
 @admin.register(SocialAgent)
 class SocialAgentAdmin(admin.ModelAdmin):
-    pass
+    list_select_related = ('user',)
 
 
 @admin.register(KnowledgeBase)
 class KnowledgeBaseAdmin(admin.ModelAdmin):
-    pass
+    list_select_related = ('user',)
 
 
 @admin.register(KnowledgeItem)
 class KnowledgeItemAdmin(admin.ModelAdmin):
-    pass
+    list_select_related = ('knowledge_base',)
 
 
 @admin.register(KnowledgeChunk)
 class KnowledgeChunkAdmin(admin.ModelAdmin):
-    pass
+    list_select_related = ('knowledge_item__knowledge_base',)
 
 
 @admin.register(AINodeConfig)
 class AINodeConfigAdmin(admin.ModelAdmin):
-    pass
+    list_select_related = ('flow_node__flow',)
 
 
 @admin.register(AIConversationMessage)
@@ -95,7 +95,7 @@ class AIConversationMessageAdmin(admin.ModelAdmin):
 
 @admin.register(AIUsageLog)
 class AIUsageLogAdmin(admin.ModelAdmin):
-    pass
+    list_select_related = ('user',)
 
 
 @admin.register(AICollectedData)
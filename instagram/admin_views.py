@@ -106,8 +106,12 @@ class AdminDashboardView(StaffRequiredMixin, View):
         if start_date:
             user_qs = user_qs.filter(date_joined__gte=start_date)
         signups = user_qs.order_by('-date_joined')
-        signup_count = signups.count()
-        google_count = signups.filter(password__startswith='!').count()
+        signup_stats = user_qs.aggregate(
+            total=Count('id'),
+            google=Count('id', filter=Q(password__startswith='!')),
+        )
+        signup_count = signup_stats['total']
+        google_count = signup_stats['google']
         password_count = signup_count - google_count
         signup_users = list(signups.values('id', 'email', 'first_name', 'last_name', 'date_joined', 'password')[:50])
         for u in signup_users:
@@ -189,12 +193,15 @@ class AdminDashboardView(StaffRequiredMixin, View):
         paid_count = paid.count()
         paid_users = list(paid[:50])
 
-        # Get current plan for paid users
+        # Get current plan for paid users in one query; pk order keeps the same
+        # row .first() returns (matches get_user_subscription)
+        active_plans = {}
+        for user_id, plan_name in Subscription.objects.filter(
+            user_id__in=[pu['user__id'] for pu in paid_users], status='active'
+        ).order_by('pk').values_list('user_id', 'plan__name'):
+            active_plans.setdefault(user_id, plan_name)
         for pu in paid_users:
-            sub = Subscription.objects.filter(
-                user_id=pu['user__id'], status='active'
-            ).select_related('plan').first()
-            pu['plan_name'] = sub.plan.name if sub else 'No active plan'
+            pu['plan_name'] = active_plans.get(pu['user__id'], 'No active plan')
 
         FUNNEL_LIMIT = 50
         return {
@@ -241,18 +248,13 @@ class AdminDashboardView(StaffRequiredMixin, View):
     def _get_user_analytics(self):
         """Get user analytics including subscription distribution"""
         # Subscription distribution by plan
-        plan_distribution = []
-        plans = Plan.objects.filter(is_active=True).order_by('order')
-
-        for plan in plans:
-            count = Subscription.objects.filter(
-                plan=plan,
-                status='active'
-            ).count()
-            plan_distribution.append({
-                'plan': plan,
-                'count': count,
-            })
+        plans = Plan.objects.filter(is_active=True).annotate(
+            active_count=Count('subscriptions', filter=Q(subscriptions__status='active'))
+        ).order_by('order')
+        plan_distribution = [
+            {'plan': plan, 'count': plan.active_count}
+            for plan in plans
+        ]
 
         # Users without active subscription (Free tier)
         users_with_active_sub = Subscription.objects.filter(
@@ -260,11 +262,13 @@ class AdminDashboardView(StaffRequiredMixin, View):
         ).values_list('user_id', flat=True).distinct()
         free_users = CustomUser.objects.exclude(id__in=users_with_active_sub).count()
 
-        # Active Instagram accounts
-        active_ig_accounts = InstagramAccount.objects.filter(is_active=True).count()
-        connected_ig_accounts = InstagramAccount.objects.filter(
-            access_token__isnull=False
-        ).exclude(access_token='').count()
+        # Active and connected Instagram accounts — single query
+        ig_stats = InstagramAccount.objects.aggregate(
+            active=Count('id', filter=Q(is_active=True)),
+            connected=Count('id', filter=Q(access_token__isnull=False) & ~Q(access_token='')),
+        )
+        active_ig_accounts = ig_stats['active']
+        connected_ig_accounts = ig_stats['connected']
 
         return {
             'plan_distribution': plan_distribution,
@@ -291,30 +295,30 @@ class AdminDashboardView(StaffRequiredMixin, View):
         completed = status_dict.get('completed', 0)
         completion_rate = round((completed / total_sessions * 100), 1) if total_sessions > 0 else 0
 
-        # Flow stats
-        total_flows = DMFlow.objects.count()
-        active_flows = DMFlow.objects.filter(is_active=True).count()
-
-        # Aggregated flow stats
+        # Flow stats (single query instead of 3)
         flow_stats = DMFlow.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True)),
             total_triggered=Sum('total_triggered'),
             total_completed=Sum('total_completed')
         )
 
         # Queued triggers
-        queued_pending = QueuedFlowTrigger.objects.filter(status='pending').count()
-        queued_failed = QueuedFlowTrigger.objects.filter(status='failed').count()
+        queued_stats = QueuedFlowTrigger.objects.aggregate(
+            pending=Count('id', filter=Q(status='pending')),
+            failed=Count('id', filter=Q(status='failed')),
+        )
 
         return {
             'status_breakdown': status_dict,
             'total_sessions': total_sessions,
             'completion_rate': completion_rate,
-            'total_flows': total_flows,
-            'active_flows': active_flows,
+            'total_flows': flow_stats['total'],
+            'active_flows': flow_stats['active'],
             'total_triggered': flow_stats['total_triggered'] or 0,
             'total_completed': flow_stats['total_completed'] or 0,
-            'queued_pending': queued_pending,
-            'queued_failed': queued_failed,
+            'queued_pending': queued_stats['pending'],
+            'queued_failed': queued_stats['failed'],
         }
 
     def _get_api_performance(self, start_date):
@@ -543,8 +547,12 @@ class AdminDashboardView(StaffRequiredMixin, View):
         if start_date:
             qs = qs.filter(created_at__gte=start_date)
 
-        total_views = qs.count()
-        total_clicked = qs.filter(clicked=True).count()
+        view_stats = qs.aggregate(
+            total=Count('id'),
+            clicked=Count('id', filter=Q(clicked=True)),
+        )
+        total_views = view_stats['total']
+        total_clicked = view_stats['clicked']
         click_rate = round((total_clicked / total_views * 100), 1) if total_views > 0 else 0
 
         # Average duration (only where duration was recorded)
@@ -605,16 +613,17 @@ class AdminQueuedFlowsView(StaffRequiredMixin, View):
         queued_flows = qs[:QUEUE_LIMIT]
 
         # Summary stats
-        total_pending = QueuedFlowTrigger.objects.filter(status='pending').count()
-        total_processing = QueuedFlowTrigger.objects.filter(status='processing').count()
-        total_completed_24h = QueuedFlowTrigger.objects.filter(
-            status='completed',
-            processed_at__gte=timezone.now() - timedelta(hours=24)
-        ).count()
-        total_failed_24h = QueuedFlowTrigger.objects.filter(
-            status='failed',
-            processed_at__gte=timezone.now() - timedelta(hours=24)
-        ).count()
+        last_24h = timezone.now() - timedelta(hours=24)
+        summary = QueuedFlowTrigger.objects.aggregate(
+            pending=Count('id', filter=Q(status='pending')),
+            processing=Count('id', filter=Q(status='processing')),
+            completed_24h=Count('id', filter=Q(status='completed', processed_at__gte=last_24h)),
+            failed_24h=Count('id', filter=Q(status='failed', processed_at__gte=last_24h)),
+        )
+        total_pending = summary['pending']
+        total_processing = summary['processing']
+        total_completed_24h = summary['completed_24h']
+        total_failed_24h = summary['failed_24h']
 
         # Per-account breakdown for pending
         account_stats = []
@@ -17,11 +17,11 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views import View
 from django.http import JsonResponse, HttpResponse
 from django.core.paginator import Paginator
-from django.db.models import Sum, Count
+from django.db.models import Sum, Count, Prefetch
 from django.utils import timezone
 
 from .models import (
-    SocialAgent, KnowledgeBase, KnowledgeItem, KnowledgeChunk,
+    SocialAgent, KnowledgeBase, KnowledgeItem,
     AINodeConfig, AIConversationMessage, AIUsageLog, AICollectedData,
     FlowNode, FlowSession, DMFlow
 )
@@ -82,20 +82,20 @@ class AgentListView(LoginRequiredMixin, AIFeatureMixin, View):
     """List all social agents for the user"""
 
     def get(self, request):
-        agents = SocialAgent.objects.filter(user=request.user).order_by('-created_at')
-
-        # Get stats for each agent
-        agent_data = []
-        for agent in agents:
-            kb_count = agent.knowledge_bases.count()
-            total_chunks = KnowledgeChunk.objects.filter(
-                knowledge_item__knowledge_base__agent=agent
-            ).count()
-            agent_data.append({
+        # Stats are annotated in the same query instead of 2 COUNTs per agent
+        agents = SocialAgent.objects.filter(user=request.user).annotate(
+            kb_count=Count('knowledge_bases'),
+            total_chunks=Sum('knowledge_bases__total_chunks'),
+        ).order_by('-created_at')
+
+        agent_data = [
+            {
                 'agent': agent,
-                'kb_count': kb_count,
-                'total_chunks': total_chunks,
-            })
+                'kb_count': agent.kb_count,
+                'total_chunks': agent.total_chunks or 0,
+            }
+            for agent in agents
+        ]
 
         context = {
             'agent_data': agent_data,
@@ -516,7 +516,11 @@ class AICollectedDataListView(LoginRequiredMixin, AIFeatureMixin, View):
         collected_data = AICollectedData.objects.filter(
             session__flow__user=request.user
         ).select_related(
-            'session', 'session__flow', 'ai_config', 'ai_config__agent'
+            'session', 'session__flow'
+        ).prefetch_related(
+            # Only the agent name is shown; avoid joining the wide config/agent rows
+            Prefetch('ai_config', queryset=AINodeConfig.objects.only('id', 'agent_id')),
+            Prefetch('ai_config__agent', queryset=SocialAgent.objects.only('id', 'name')),
         ).order_by('-created_at')
 
         # Apply filters
@@ -610,18 +614,18 @@ class AICollectedDataExportView(LoginRequiredMixin, AIFeatureMixin, View):
         response = HttpResponse(content_type='text/csv')
         response['Content-Disposition'] = 'attachment; filename="ai_collected_data.csv"'
 
-        # Collect all fields
+        # Collect all fields (only scan the data column)
         all_fields = set(['instagram_username', 'flow_name', 'completion_percentage', 'created_at'])
-        for data in collected_data:
-            if data.data:
-                all_fields.update(data.data.keys())
+        for field_data in collected_data.values_list('data', flat=True).iterator(chunk_size=500):
+            if field_data:
+                all_fields.update(field_data.keys())
 
         all_fields = sorted(all_fields)
 
         writer = csv.writer(response)
         writer.writerow(all_fields)
 
-        for data in collected_data:
+        for data in collected_data.iterator(chunk_size=500):
             row = []
             for field in all_fields:
                 if field == 'instagram_username':
@@ -436,14 +436,14 @@ class KnowledgeService:
             embedder = EmbeddingGenerator()
             total_tokens = 0
             total_cost = 0.0
+            chunk_records = []
 
             for chunk_data in chunks:
                 embedding, tokens = embedder.generate_embedding(chunk_data['content'])
                 if not embedding:
                     continue
 
-                # Create chunk record
-                KnowledgeChunk.objects.create(
+                chunk_records.append(KnowledgeChunk(
                     knowledge_item=item,
                     content=chunk_data['content'],
                     chunk_index=chunk_data['index'],
@@ -453,9 +453,12 @@ class KnowledgeService:
                         **metadata,
                         'chunk_index': chunk_data['index']
                     }
-                )
+                ))
                 total_tokens += tokens
 
+            # Insert all chunk records in one round trip
+            KnowledgeChunk.objects.bulk_create(chunk_records, batch_size=500)
+
             # Calculate cost
             cost_per_1k = AI_CREDITS.get('EMBEDDING_COST_PER_1K_TOKENS', 0.02)
             total_cost = (total_tokens / 1000) * cost_per_1k
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-18 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('instagram', '0022_alter_aiusagelog_user_alter_apicalllog_account'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dmflow',
+            index=models.Index(fields=['user', 'is_active', '-created_at'], name='instagram_d_user_id_33975e_idx'),
+        ),
+    ]
@@ -210,6 +210,10 @@ class DMFlow(models.Model):
         verbose_name = "DM Flow"
         verbose_name_plural = "DM Flows"
         ordering = ['-created_at']
+        indexes = [
+            # find_matching_flow runs on every comment webhook
+            models.Index(fields=['user', 'is_active', '-created_at']),
+        ]
 
 
 class FlowNode(models.Model):
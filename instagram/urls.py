@@ -4,6 +4,9 @@ from . import ai_views
 from . import admin_views
 
 urlpatterns = [
+    # Webhook (first: hit by Instagram for every comment/message event)
+    path('webhook/', views.InstagramWebhookView.as_view(), name='instagram_webhook'),
+
     # Admin Dashboard
     path('admin/dashboard/', admin_views.AdminDashboardView.as_view(), name='instagram_admin_dashboard'),
     path('admin/queue/', admin_views.AdminQueuedFlowsView.as_view(), name='instagram_admin_queue'),
@@ -60,9 +63,6 @@ urlpatterns = [
     # Internal API (Lambda → Django)
     path('api/internal/process-trigger/<int:pk>/', views.ProcessQueuedTriggerAPIView.as_view(), name='internal_process_trigger'),
 
-    # Webhook
-    path('webhook/', views.InstagramWebhookView.as_view(), name='instagram_webhook'),
-
     # Facebook App Callback URLs (Required for App Review)
     path('data-deletion/', views.DataDeletionCallbackView.as_view(), name='instagram_data_deletion'),
     path('deauthorize/', views.DeauthorizationCallbackView.as_view(), name='instagram_deauthorize'),
@@ -1242,13 +1242,15 @@ class FlowCreateView(IGFlowBuilderFeatureMixin, LoginRequiredMixin, View):
 
             # Create quick reply options if present (without target_node for now)
             quick_replies = node_data.get('quick_replies', [])
-            for qr_idx, qr_data in enumerate(quick_replies):
-                QuickReplyOption.objects.create(
+            QuickReplyOption.objects.bulk_create([
+                QuickReplyOption(
                     node=node,
                     title=qr_data.get('title', ''),
                     payload=qr_data.get('payload', f'qr_{qr_idx}'),
                     order=qr_idx,
                 )
+                for qr_idx, qr_data in enumerate(quick_replies)
+            ])
 
         # Second pass: resolve all connections using string IDs
         for idx, node_data in enumerate(nodes_data):
@@ -1313,7 +1315,14 @@ class FlowEditView(IGFlowBuilderFeatureMixin, LoginRequiredMixin, View):
             flow = get_object_or_404(DMFlow, pk=pk)
         else:
             flow = get_object_or_404(DMFlow, pk=pk, user=request.user)
-        nodes = flow.nodes.all().order_by('order').prefetch_related('quick_reply_options')
+        nodes = flow.nodes.all().order_by('order').prefetch_related(
+            models.Prefetch(
+                'quick_reply_options',
+                queryset=QuickReplyOption.objects.only(
+                    'id', 'node_id', 'title', 'payload', 'target_node_id', 'order'
+                ).order_by('order'),
+            )
+        )
 
         features = self._get_user_features(request.user)
 
@@ -1322,7 +1331,7 @@ class FlowEditView(IGFlowBuilderFeatureMixin, LoginRequiredMixin, View):
         for node in nodes:
             # Get quick replies for this node
             quick_replies = []
-            for qr in node.quick_reply_options.all().order_by('order'):
+            for qr in node.quick_reply_options.all():
                 quick_replies.append({
                     'id': qr.id,
                     'title': qr.title,
@@ -1458,12 +1467,19 @@ class FlowEditWizardView(IGFlowBuilderFeatureMixin, LoginRequiredMixin, View):
             flow = get_object_or_404(DMFlow, pk=pk)
         else:
             flow = get_object_or_404(DMFlow, pk=pk, user=request.user)
-        nodes = flow.nodes.all().order_by('order').prefetch_related('quick_reply_options')
+        nodes = flow.nodes.all().order_by('order').prefetch_related(
+            models.Prefetch(
+                'quick_reply_options',
+                queryset=QuickReplyOption.objects.only(
+                    'id', 'node_id', 'title', 'payload', 'target_node_id', 'order'
+                ).order_by('order'),
+            )
+        )
 
         nodes_json = []
         for node in nodes:
             quick_replies = []
-            for qr in node.quick_reply_options.all().order_by('order'):
+            for qr in node.quick_reply_options.all():
                 quick_replies.append({
                     'id': qr.id,
                     'title': qr.title,
@@ -1604,7 +1620,7 @@ class FlowSaveVisualView(IGFlowBuilderFeatureMixin, LoginRequiredMixin, View):
                             node.order = order
                             node.node_type = node_type
                             node.config = config
-                            node.save()
+                            node.save(update_fields=['order', 'node_type', 'config', 'updated_at'])
                             keep_node_ids.add(node.id)
                             node_objects[node_id] = (node, node_data)
                             # Map all IDs to db_id for existing nodes
@@ -1716,7 +1732,7 @@ class FlowSaveVisualView(IGFlowBuilderFeatureMixin, LoginRequiredMixin, View):
 
                     if config_updated:
                         node.config = config
-                        node.save()
+                        node.save(update_fields=['config', 'updated_at'])
 
                     # Handle quick replies
                     quick_replies_data = node_data.get('quick_replies', [])
@@ -1726,16 +1742,16 @@ class FlowSaveVisualView(IGFlowBuilderFeatureMixin, LoginRequiredMixin, View):
                         node.quick_reply_options.all().delete()
 
                         # Create new quick replies with resolved target_node_ids
-                        for idx, qr_data in enumerate(quick_replies_data):
-                            raw_target = qr_data.get('target_node_id')
-                            resolved_target = resolve_target_id(raw_target)
-                            QuickReplyOption.objects.create(
+                        QuickReplyOption.objects.bulk_create([
+                            QuickReplyOption(
                                 node=node,
                                 title=qr_data.get('title', ''),
                                 payload=qr_data.get('payload', f'qr_{idx}'),
                                 order=idx,
-                                target_node_id=resolved_target
+                                target_node_id=resolve_target_id(qr_data.get('target_node_id'))
                             )
+                            for idx, qr_data in enumerate(quick_replies_data)
+                        ])
 
                 # Note: Deletion already happened at the beginning of the transaction
 
@@ -1831,7 +1847,7 @@ class FlowSessionsView(IGFlowBuilderFeatureMixin, LoginRequiredMixin, View):
 
         flow = get_object_or_404(DMFlow, pk=pk)
 
-        sessions = flow.sessions.all().order_by('-created_at')
+        sessions = flow.sessions.select_related('current_node').order_by('-created_at')
 
         # Filter by status
         status_filter = request.GET.get('status', '')
@@ -1883,7 +1899,10 @@ class FlowSessionDetailView(IGFlowBuilderFeatureMixin, LoginRequiredMixin, View)
         # Get execution logs for this session (exclude generic node_executed logs)
         logs = session.execution_logs.exclude(
             action='node_executed'
-        ).order_by('created_at').select_related('node')
+        ).order_by('created_at').select_related('node').only(
+            'action', 'details', 'created_at', 'session_id',
+            'node__id', 'node__node_type', 'node__name',
+        )
 
         context = {
             'flow': flow,
@@ -1949,6 +1968,7 @@ class FlowNodeCreateView(IGFlowBuilderFeatureMixin, LoginRequiredMixin, View):
 
         # Handle quick reply options if provided
         quick_replies = data.get('quick_replies', [])
+        options = []
         for i, qr in enumerate(quick_replies):
             target_node = None
             target_node_id = qr.get('target_node_id')
@@ -1958,13 +1978,14 @@ class FlowNodeCreateView(IGFlowBuilderFeatureMixin, LoginRequiredMixin, View):
                 except FlowNode.DoesNotExist:
                     pass
 
-            QuickReplyOption.objects.create(
+            options.append(QuickReplyOption(
                 node=node,
                 title=qr.get('title', '')[:20],
                 payload=qr.get('payload', f'opt_{i}'),
                 order=i,
                 target_node=target_node,
-            )
+            ))
+        QuickReplyOption.objects.bulk_create(options)
 
         return JsonResponse({
             'success': True,
@@ -2008,6 +2029,7 @@ class FlowNodeUpdateView(IGFlowBuilderFeatureMixin, LoginRequiredMixin, View):
         if 'quick_replies' in data:
             # Delete existing and recreate
             node.quick_reply_options.all().delete()
+            options = []
             for i, qr in enumerate(data['quick_replies']):
                 target_node_id = qr.get('target_node_id')
                 target_node = None
@@ -2017,13 +2039,14 @@ class FlowNodeUpdateView(IGFlowBuilderFeatureMixin, LoginRequiredMixin, View):
                     except FlowNode.DoesNotExist:
                         pass
 
-                QuickReplyOption.objects.create(
+                options.append(QuickReplyOption(
                     node=node,
                     title=qr.get('title', '')[:20],
                     payload=qr.get('payload', f'opt_{i}'),
                     order=i,
                     target_node=target_node,
-                )
+                ))
+            QuickReplyOption.objects.bulk_create(options)
 
         return JsonResponse({'success': True})
 
@@ -2457,15 +2480,19 @@ class QueuedFlowTriggerView(IGFlowBuilderFeatureMixin, LoginRequiredMixin, View)
         if FlowSession.objects.filter(trigger_comment_id=ctx.get('comment_id', '')).exists():
             queued.status = 'completed'
             queued.processed_at = timezone.now()
-            queued.save()
+            queued.save(update_fields=['status', 'processed_at'])
             messages.info(request, 'This comment was already processed.')
             return redirect('queued_flows')
 
+        # Claim the trigger with a conditional UPDATE so a concurrent Lambda run
+        # cannot process it at the same time
+        if not QueuedFlowTrigger.objects.filter(pk=queued.pk, status='pending').update(status='processing'):
+            messages.info(request, 'This trigger is already being processed.')
+            return redirect('queued_flows')
+        queued.status = 'processing'
+
         # Trigger the flow
         try:
-            queued.status = 'processing'
-            queued.save()
-
             engine = FlowEngine(instagram_account)
 
             if queued.trigger_type == 'comment':
@@ -2481,7 +2508,7 @@ class QueuedFlowTriggerView(IGFlowBuilderFeatureMixin, LoginRequiredMixin, View)
 
             queued.status = 'completed'
             queued.processed_at = timezone.now()
-            queued.save()
+            queued.save(update_fields=['status', 'processed_at'])
 
             messages.success(request, f'Flow "{queued.flow.title}" triggered successfully!')
 
@@ -2490,7 +2517,7 @@ class QueuedFlowTriggerView(IGFlowBuilderFeatureMixin, LoginRequiredMixin, View)
             queued.status = 'failed'
             queued.error_message = str(e)
             queued.processed_at = timezone.now()
-            queued.save()
+            queued.save(update_fields=['status', 'error_message', 'processed_at'])
             messages.error(request, f'Failed to trigger flow: {str(e)}')
 
         return redirect('queued_flows')
@@ -2548,16 +2575,20 @@ class ProcessQueuedTriggerAPIView(View):
         if comment_id and FlowSession.objects.filter(trigger_comment_id=comment_id).exists():
             queued.status = 'completed'
             queued.processed_at = timezone.now()
-            queued.save()
+            queued.save(update_fields=['status', 'processed_at'])
             print(f"[QueueProcessor] Trigger {pk} skipped — dedup (comment {comment_id} already processed)", flush=True)
             return JsonResponse({'status': 'skipped', 'message': 'Already processed (dedup)'})
 
+        # Claim the trigger with a conditional UPDATE so overlapping Lambda runs or
+        # a manual trigger cannot process it twice
+        if not QueuedFlowTrigger.objects.filter(pk=pk, status='pending').update(status='processing'):
+            print(f"[QueueProcessor] Trigger {pk} skipped — claimed by another worker", flush=True)
+            return JsonResponse({'status': 'skipped', 'message': 'Trigger is already being processed'})
+        queued.status = 'processing'
+        print(f"[QueueProcessor] Trigger {pk}: status set to processing", flush=True)
+
         # Trigger the flow
         try:
-            queued.status = 'processing'
-            queued.save()
-            print(f"[QueueProcessor] Trigger {pk}: status set to processing", flush=True)
-
             engine = FlowEngine(instagram_account)
 
             if queued.trigger_type == 'comment':
@@ -2576,7 +2607,7 @@ class ProcessQueuedTriggerAPIView(View):
 
             queued.status = 'completed'
             queued.processed_at = timezone.now()
-            queued.save()
+            queued.save(update_fields=['status', 'processed_at'])
 
             print(f"[QueueProcessor] Trigger {pk}: SUCCESS — flow '{queued.flow.title}' triggered", flush=True)
             return JsonResponse({'status': 'success', 'message': f'Flow "{queued.flow.title}" triggered'})
@@ -2586,7 +2617,7 @@ class ProcessQueuedTriggerAPIView(View):
             queued.status = 'failed'
             queued.error_message = str(e)
             queued.processed_at = timezone.now()
-            queued.save()
+            queued.save(update_fields=['status', 'error_message', 'processed_at'])
             return JsonResponse({'status': 'failed', 'error': str(e)}, status=500)
 
 
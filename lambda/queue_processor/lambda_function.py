@@ -109,16 +109,19 @@ def get_rate_limit(cursor, account_id):
     return 200
 
 
-def process_trigger(app_url, api_key, trigger_id):
+def get_http_session(api_key):
+    """Create a keep-alive session shared by all trigger calls in this run."""
+    session = requests.Session()
+    session.headers['X-Internal-API-Key'] = api_key
+    return session
+
+
+def process_trigger(session, app_url, trigger_id):
     """Call Django internal API to process a single trigger."""
     url = f"{app_url}/instagram/api/internal/process-trigger/{trigger_id}/"
     print(f"  POST {url}")
     try:
-        response = requests.post(
-            url,
-            headers={'X-Internal-API-Key': api_key},
-            timeout=60,
-        )
+        response = session.post(url, timeout=60)
         body = response.json() if response.headers.get('content-type', '').startswith('application/json') else response.text
         print(f"  Response {response.status_code}: {body}")
         return {
@@ -168,6 +171,7 @@ def handler(event, context):
     }
 
     conn = None
+    session = get_http_session(api_key)
     try:
         conn = get_db_connection(config)
         cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
@@ -239,7 +243,7 @@ def handler(event, context):
                         break
 
                     print(f"  [{i+1}/{len(eligible)}] Trigger {trigger['id']} (flow={trigger['flow_id']}, created={trigger['created_at']})")
-                    result = process_trigger(app_url, api_key, trigger['id'])
+                    result = process_trigger(session, app_url, trigger['id'])
                     account_summary['results'].append(result)
                     if result['success']:
                         summary['processed'] += 1
@@ -265,6 +269,7 @@ def handler(event, context):
             'body': json.dumps({'error': str(e)}),
         }
     finally:
+        session.close()
         if conn:
             conn.close()
             print("DB connection closed")
@@ -29,11 +29,13 @@ urlpatterns = [
     path('ads.txt', ads_txt, name='ads_txt'),
     path('sitemap.xml', sitemap, {'sitemaps': sitemaps}, name='sitemap'),
     path('ckeditor5/', include('django_ckeditor_5.urls')),
-    path('', include('core.urls')),
-    path('users/', include('users.urls')),
+    # Prefixed apps first: the Instagram webhook is the busiest route and
+    # should not be tried against every un-prefixed core pattern
     path('instagram/', include('instagram.urls')),
+    path('users/', include('users.urls')),
     path('youtube/', include('youtube.urls')),
     path('blog/', include('blog.urls')),
+    path('', include('core.urls')),
 
     # Public profile routes (must be LAST to avoid collisions)
     path('@<str:username>/', PublicProfileView.as_view(), name='public_profile'),
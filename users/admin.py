@@ -10,12 +10,12 @@ class CustomUserAdmin(BaseUserAdmin):
 
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
-    pass
+    list_select_related = ('user',)
 
 
 @admin.register(UserStats)
 class UserStatsAdmin(admin.ModelAdmin):
-    pass
+    list_select_related = ('user',)
 
 
 @admin.register(UserAcquisition)
@@ -28,10 +28,15 @@ YOUTUBE_SCOPES = [
 
 def get_youtube_config():
     """Get YouTube OAuth configuration from database"""
+    values = Configuration.get_values({
+        'youtube_client_id': '',
+        'youtube_client_secret': '',
+        'app_root_url': '',
+    })
     return {
-        'client_id': Configuration.get_value('youtube_client_id', ''),
-        'client_secret': Configuration.get_value('youtube_client_secret', ''),
-        'app_root_url': Configuration.get_value('app_root_url', ''),
+        'client_id': values['youtube_client_id'],
+        'client_secret': values['youtube_client_secret'],
+        'app_root_url': values['app_root_url'],
     }
 
 